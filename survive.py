@@ -1,8 +1,11 @@
 import math
 import random
+from bisect import bisect_left, bisect_right
 import sys
 import time
-from typing import List, Sequence, cast
+from collections import defaultdict
+from functools import lru_cache
+from typing import Sequence, cast
 
 import pygame as pg
 from pygame.rect import Rect
@@ -14,6 +17,18 @@ pg.mixer.init()
 WIDTH = 1600  # ゲームウィンドウの幅
 HEIGHT = 900  # ゲームウィンドウの高さ
 
+# 効果音（再生のたびにmp3をデコードしないよう起動時に一度だけ読み込む）
+SE_BULLET = pg.mixer.Sound("./fig/se_bullet.mp3")
+SE_ENEMY_DAMAGE = pg.mixer.Sound("./fig/se_enemy_damage.mp3")
+SE_ENEMY_DEATH = pg.mixer.Sound("./fig/se_enemy_death.mp3")
+SE_POWERUP = pg.mixer.Sound("./fig/se_powerup.mp3")
+
+# pygame-ceのSurface.fblits（まとめて描画する高速版のblits）が使えるかどうか
+HAS_FBLITS = hasattr(Surface, "fblits")
+
+# 1度刻みの単位ベクトル（y軸は画面下向きなのでsinの符号を反転）
+UNIT_CIRCLE = [(math.cos(math.radians(a)), -math.sin(math.radians(a))) for a in range(360)]
+
 def clamp(v, small, large):
     return max(small, min(v, large))
 
@@ -32,6 +47,8 @@ class Camera():
         """
         self.screen = screen
         self.center_pos = [0, 0]
+        self.offset = self.compute_offset()
+        self.view_rect = pg.Rect(self.offset, self.screen.get_size())
         self.targetCharacter = targetCharacter
         if is_acrive_now:
             self.__class__.active_camera = self
@@ -44,6 +61,17 @@ class Camera():
         self.center_pos = list(self.targetCharacter.rect.center)
         self.center_pos[0] = clamp(self.center_pos[0], -MoveArea.width / 2 + self.screen.get_width() / 2, MoveArea.width / 2 - self.screen.get_width() / 2)
         self.center_pos[1] = clamp(self.center_pos[1], -MoveArea.height / 2 + self.screen.get_height() / 2, MoveArea.height / 2 - self.screen.get_height() / 2)
+        self.offset = self.compute_offset()
+        # 画面に映る範囲（ワールド座標）
+        self.view_rect.topleft = self.offset
+
+    def compute_offset(self) -> tuple[float, float]:
+        """
+        ワールド座標から画面座標に変換する際に引く量を計算する関数
+        戻り値: 画面左上のワールド座標
+        """
+        return (self.center_pos[0] - self.screen.get_width() / 2,
+                self.center_pos[1] - self.screen.get_height() / 2)
 
     def is_in_camera(self, pos: tuple[int, int]) -> tuple[bool, bool]:
         return (
@@ -57,32 +85,33 @@ class Group_support_camera(pg.sprite.Group):
     Surfaceをカメラ位置に同期して描画するためのグループクラス
     """
     def __init__(self, *sprites: Sprite | Sequence[Sprite]) -> None:
+        # 描画するSpriteのリスト（グループの中身が変わったときだけ作り直す）
+        self._drawlist: list[Sprite] | None = None
         super().__init__(*sprites)
 
-    def draw(self, surface: Surface) -> List[Rect]:
+    def add_internal(self, sprite: Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self._drawlist = None
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        self._drawlist = None
+
+    def draw(self, surface: Surface) -> None:
         """
         グループ内にあるSpriteをカメラ位置に合わせて描画する関数
         引数1: 描画先のSurface
         """
-        camera = Camera.active_camera
-        # カメラ位置だけSprite達をずらす
-        for sprite in self.sprites():
-            sprite.rect.move_ip(
-                -camera.center_pos[0] + camera.screen.get_width() / 2,
-                -camera.center_pos[1] + camera.screen.get_height() / 2
-            )
-
-        # 描画
-        rst = super().draw(surface)
-
-        # 動かしたSprite達の位置を戻す
-        for sprite in self.sprites():
-            sprite.rect.move_ip(
-                camera.center_pos[0] - camera.screen.get_width() / 2,
-                camera.center_pos[1] - camera.screen.get_height() / 2
-            )
-
-        return rst
+        # Spriteの位置は動かさず、カメラ位置だけずらした座標にまとめて描画（画面外のSpriteは描画しない）
+        offset_x, offset_y = Camera.active_camera.offset
+        view_rect = Camera.active_camera.view_rect
+        if self._drawlist is None:
+            self._drawlist = self.sprites()
+        blit_seq = [(sprite.image, (sprite.rect.x - offset_x, sprite.rect.y - offset_y)) for sprite in self._drawlist if view_rect.colliderect(sprite.rect)]
+        if HAS_FBLITS:
+            surface.fblits(blit_seq)
+        else:
+            surface.blits(blit_seq, doreturn=False)
     
 class MoveArea():
     width: int = 4000
@@ -114,6 +143,7 @@ class Character(pg.sprite.Sprite):
         self.max_invincible_tick = max_invincible_sec
         self.invincible_tmr = -1
         self._imgs: dict[int, list[Surface, (int | None)]] = {}
+        self._top_priority: int | None = None  # _imgsの中で最も高い優先度
         self.set_image(image, 0)
         self.rect = image.get_rect()
         self.rect.center = position
@@ -126,6 +156,8 @@ class Character(pg.sprite.Sprite):
         引数3: 画像を描画する期間（Noneで無期限になります）
         """
         self._imgs[priority] = [image, valid_time]
+        if self._top_priority is None or priority > self._top_priority:
+            self._top_priority = priority
 
     def give_damage(self, damage: int) -> int:
         """
@@ -148,28 +180,30 @@ class Character(pg.sprite.Sprite):
         # カメラからの距離によって音量を変える
         volume_range = 1500
         volume = max((volume_range - calc_norm(self.rect.center, Camera.active_camera.center_pos)) / volume_range, 0)
-        if self.hp > 0:
-            sound = pg.mixer.Sound("./fig/se_enemy_damage.mp3")
-            sound.set_volume(volume)
-            sound.play()
-        else:
-            sound = pg.mixer.Sound("./fig/se_enemy_death.mp3")
-            sound.set_volume(volume)
-            sound.play()
+        # 聞こえない距離ならミキサーに再生を投げない
+        if volume <= 0:
+            return
+        sound = SE_ENEMY_DAMAGE if self.hp > 0 else SE_ENEMY_DEATH
+        channel = sound.play()
+        # Soundは共有しているので音量は再生したチャンネル側に設定する
+        if channel is not None:
+            channel.set_volume(volume)
 
     def update(self, delta_time: float):
         # 無敵時間を減らす処理
         self.invincible_tmr = max(self.invincible_tmr - delta_time, -1)
 
         # 表示する画像周りの処理
-        if len(self._imgs) > 0:
+        if self._top_priority is not None:
             # 優先度が最も高い画像を描画
-            idx = max(self._imgs)
+            idx = self._top_priority
             self.image = self._imgs[idx][0]
             # 画像の有効時間を減らす処理
             if self._imgs[idx][1] != None:
                 if self._imgs[idx][1] < 0:
                     del self._imgs[idx]
+                    # 最も高い優先度は画像が消えたときだけ求め直す
+                    self._top_priority = max(self._imgs) if self._imgs else None
                     return
                 self._imgs[idx][1] -= delta_time
 
@@ -182,7 +216,7 @@ def calc_orientation(org: tuple[int, int], dst: tuple[int, int]) -> tuple[float,
     戻り値:orgから見たdstの方向ベクトルを表すタプル
     """
     x_diff, y_diff = dst[0] - org[0], dst[1] - org[1]
-    norm = math.sqrt(x_diff ** 2 + y_diff ** 2)
+    norm = math.hypot(x_diff, y_diff)
     return x_diff / norm, y_diff / norm
 
 
@@ -202,8 +236,7 @@ def calc_norm(org: tuple[int, int], dst: tuple[int, int]) -> float:
     引数2 dst:座標
     戻り値:距離
     """
-    x_diff, y_diff = dst[0] - org[0], dst[1] - org[1]
-    return math.sqrt(x_diff ** 2 + y_diff ** 2)
+    return math.dist(org, dst)
 
 
 class Player(Character):
@@ -214,12 +247,8 @@ class Player(Character):
     # Playerの画像の表示倍率
     IMAGE_SCALE = 1.2
 
-    delta = {  # 押下キーと移動量の辞書
-        pg.K_w: (0, -1),
-        pg.K_s: (0, +1),
-        pg.K_a: (-1, 0),
-        pg.K_d: (+1, 0),
-    }
+    # 向きごとのPlayer画像（最初のPlayer生成時に一度だけ作る）
+    _MOVE_IMGS: dict[tuple[int, int], Surface] | None = None
 
     def __init__(self, xy: list[int, int], effect_group: pg.sprite.Group, hp=50, max_invincible_sec=0.5):
         """
@@ -228,19 +257,7 @@ class Player(Character):
         引数2: hp(任意)
         引数3: ダメージを受けた際の無敵時間（任意）
         """
-        img0 = pg.transform.rotozoom(
-            pg.image.load(f"./fig/3.png"), 0, self.IMAGE_SCALE)
-        img = pg.transform.flip(img0, True, False)
-        self.move_imgs = {
-            (+1, 0): img,  # 右
-            (+1, -1): pg.transform.rotozoom(img, 45, 1.0),  # 右上
-            (0, -1): pg.transform.rotozoom(img, 90, 1.0),  # 上
-            (-1, -1): pg.transform.rotozoom(img0, -45, 1.0),  # 左上
-            (-1, 0): img0,  # 左
-            (-1, +1): pg.transform.rotozoom(img0, 45, 1.0),  # 左下
-            (0, +1): pg.transform.rotozoom(img, -90, 1.0),  # 下
-            (+1, +1): pg.transform.rotozoom(img, -45, 1.0),  # 右下
-        }
+        self.move_imgs = self._load_move_imgs()
         self.dire = (1, 0)
         super().__init__(self.move_imgs[self.dire], xy ,hp, max_invincible_sec)
         self.speed = 500
@@ -248,6 +265,28 @@ class Player(Character):
         self.attack_number = 1
         effect_group.add(HP_Bar(self))
 
+    @classmethod
+    def _load_move_imgs(cls) -> dict[tuple[int, int], Surface]:
+        """
+        向きごとのPlayer画像の辞書を返す関数
+        戻り値: 方向ベクトルをキーとする画像の辞書
+        """
+        if cls._MOVE_IMGS is None:
+            img0 = pg.transform.rotozoom(
+                pg.image.load(f"./fig/3.png").convert_alpha(), 0, cls.IMAGE_SCALE)
+            img = pg.transform.flip(img0, True, False)
+            cls._MOVE_IMGS = {
+                (+1, 0): img,  # 右
+                (+1, -1): pg.transform.rotozoom(img, 45, 1.0),  # 右上
+                (0, -1): pg.transform.rotozoom(img, 90, 1.0),  # 上
+                (-1, -1): pg.transform.rotozoom(img0, -45, 1.0),  # 左上
+                (-1, 0): img0,  # 左
+                (-1, +1): pg.transform.rotozoom(img0, 45, 1.0),  # 左下
+                (0, +1): pg.transform.rotozoom(img, -90, 1.0),  # 下
+                (+1, +1): pg.transform.rotozoom(img, -45, 1.0),  # 右下
+            }
+        return cls._MOVE_IMGS
+
     def change_img(self, num: int, priority: int, life: int | None = None):
         """
         Player画像を設定する関数
@@ -255,7 +294,7 @@ class Player(Character):
         引数2: 画像の優先度
         引数3: 表示する期間（Noneで無期限）
         """
-        self.set_image(pg.transform.rotozoom(pg.image.load(f"./fig/{num}.png"), 0, self.IMAGE_SCALE), priority, life)
+        self.set_image(pg.transform.rotozoom(pg.image.load(f"./fig/{num}.png").convert_alpha(), 0, self.IMAGE_SCALE), priority, life)
 
     def damaged(self):
         """
@@ -272,20 +311,20 @@ class Player(Character):
         引数1: key_lst：押下キーの真理値リスト
         """
         super().update(dtime)
-        sum_mv = [0, 0]
-        for k, mv in Player.delta.items():
-            if key_lst[k]:
-                move_vec = [self.speed * mv[0] * dtime, self.speed * mv[1] * dtime]
-                movable = MoveArea.is_in_area((self.rect.center[0] + move_vec[0], self.rect.center[1] + move_vec[1]))
-                if movable[0]:
-                    self.rect.move_ip(move_vec[0], 0)
-                if movable[1]:
-                    self.rect.move_ip(0, move_vec[1])
-                sum_mv[0] += mv[0]
-                sum_mv[1] += mv[1]
-        if not (sum_mv[0] == 0 and sum_mv[1] == 0):
-            self.dire = tuple(sum_mv)
-            self.set_image(self.move_imgs[self.dire], 0)
+        # WASDの押下状態から移動方向を求める（反対向きのキーは打ち消し合う）
+        dx = key_lst[pg.K_d] - key_lst[pg.K_a]
+        dy = key_lst[pg.K_s] - key_lst[pg.K_w]
+        if dx or dy:
+            move_vec = (self.speed * dx * dtime, self.speed * dy * dtime)
+            movable = MoveArea.is_in_area((self.rect.center[0] + move_vec[0], self.rect.center[1] + move_vec[1]))
+            if movable[0]:
+                self.rect.move_ip(move_vec[0], 0)
+            if movable[1]:
+                self.rect.move_ip(0, move_vec[1])
+            # 向きが変わったときだけ画像を差し替える
+            if (dx, dy) != self.dire:
+                self.dire = (dx, dy)
+                self.set_image(self.move_imgs[self.dire], 0)
 
     def get_direction(self) -> tuple[int, int]:
         """
@@ -298,6 +337,23 @@ class Player(Character):
         pass
 
 
+# 弾画像の回転角度の分割数
+ROTATION_BUCKETS = 64
+
+
+@lru_cache(maxsize=256)
+def get_rotated_image(image: Surface, bucket: int) -> Surface:
+    """
+    回転済みの弾画像を返す関数（同じ画像・角度の組み合わせは使い回す）
+    引数1 image:回転前の画像
+    引数2 bucket:角度を ROTATION_BUCKETS 分割したときの番号
+    戻り値:回転後の画像
+    """
+    rotated = pg.transform.rotozoom(image, bucket * 360 / ROTATION_BUCKETS, 1)
+    rotated.set_colorkey((0,0,0))
+    return rotated
+
+
 class Bullet(pg.sprite.Sprite):
     """
     弾に関するクラス
@@ -312,51 +368,117 @@ class Bullet(pg.sprite.Sprite):
                  damage: int=10,
                  life_sec=5,
                  is_fix_rotation_img=False,
-                 is_destoroy_when_off_screen=False):
+                 is_destoroy_when_off_screen=False,
+                 angle: float | None = None):
         """
         銃弾Surfaceを生成する
         引数1: スポーン位置
         引数2: 飛ばす方向
+        引数 angle: 画像の回転角度[度]（呼び出し側で分かっている場合に渡すと方向からの再計算を省ける）
         """
         super().__init__()
         self.vx, self.vy = direction
         self.image = image
         if not is_fix_rotation_img:
-            angle = math.degrees(math.atan2(-self.vy, self.vx))
-            self.image = pg.transform.rotozoom(image, angle, 1)
-            self.image.set_colorkey((0,0,0))
+            if angle is None:
+                angle = math.degrees(math.atan2(-self.vy, self.vx))
+            self.image = get_rotated_image(image, round(angle / 360 * ROTATION_BUCKETS) % ROTATION_BUCKETS)
         self.rect = self.image.get_rect()
         self.rect.center = position
         self.speed = speed
+        # 1秒あたりの移動量（毎フレームの掛け算を減らすため生成時に計算しておく）
+        self.velocity = (speed * self.vx, speed * self.vy)
         self.life_tmr = 0
         self.attackable_group = attackable_group
         self.damage = damage
         self.max_life_sec = life_sec
         self.isdestoroy_when_off_screen = is_destoroy_when_off_screen
 
-    def update(self, dtime: float, score: "Score"):
+    def update(self, dtime: float):
         """
-        銃弾を移動させる
+        銃弾を移動させる（当たり判定は collide_bullets でまとめて行う）
         """
         # 移動
-        self.rect.move_ip(self.speed * self.vx * dtime, self.speed * self.vy * dtime)
-        in_camera = Camera.active_camera.is_in_camera(self.rect.center)
-        is_in_camera = in_camera[0] and in_camera[1]
-        if self.life_tmr > self.max_life_sec or (self.isdestoroy_when_off_screen and not is_in_camera):
+        self.rect.move_ip(self.velocity[0] * dtime, self.velocity[1] * dtime)
+        if self.life_tmr > self.max_life_sec:
+            self.kill()
+        elif self.isdestoroy_when_off_screen and not Camera.active_camera.view_rect.colliderect(self.rect):
             self.kill()
         self.life_tmr += dtime
 
-        # 衝突判定
-        for damage_target in pg.sprite.spritecollide(self, self.attackable_group, False):
-            self.kill()
 
-            damage_target = cast(Character, damage_target)
-            damage_target.give_damage(self.damage)
+def collide_bullets(bullets: pg.sprite.Group, score: "Score") -> None:
+    """
+    グループ内の銃弾とその攻撃対象との当たり判定をまとめて行う関数
+    引数1 bullets:銃弾のグループ
+    引数2 score:敵を倒したときに加算するスコア
+    """
+    # 攻撃対象グループごとに、左端のx座標でソートしたRectのリストをフレーム内で一度だけ作る
+    targets: dict[pg.sprite.Group, tuple[list[Sprite], list[Rect], list[int], int]] = {}
+    for bullet in bullets.sprites():
+        bullet = cast(Bullet, bullet)
+        if bullet.attackable_group not in targets:
+            sprites = sorted(bullet.attackable_group.sprites(), key=lambda sprite: sprite.rect.left)
+            rects = [sprite.rect for sprite in sprites]
+            lefts = [rect.left for rect in rects]
+            max_width = max((rect.width for rect in rects), default=0)
+            targets[bullet.attackable_group] = (sprites, rects, lefts, max_width)
+        sprites, rects, lefts, max_width = targets[bullet.attackable_group]
+
+        # x方向で重なり得る範囲だけに絞ってから判定する
+        # （左端が bullet.left - max_width 以下の相手は右端が bullet.left に届かない）
+        lo = bisect_right(lefts, bullet.rect.left - max_width)
+        hi = bisect_left(lefts, bullet.rect.right)
+        for i in bullet.rect.collidelistall(rects[lo:hi]):
+            damage_target = cast(Character, sprites[lo + i])
+            # このフレームで既に倒された相手には当たらない
+            if not damage_target.alive():
+                continue
+            bullet.kill()
+
+            damage_target.give_damage(bullet.damage)
             # TODO: Enemy_Baseに依存させるのは良くないのでIScoreable的なのを作ってそこに依存させる
             if damage_target.hp <= 0 and issubclass(type(damage_target), Enemy_Base):
                 score.score_up(damage_target.get_score())
 
 
+def _rect_cells(rect: Rect, cell_size: int):
+    """
+    rectが重なっているグリッドのセルを列挙する関数
+    引数1 rect:Rect
+    引数2 cell_size:セルの一辺の長さ
+    """
+    for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+        for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+            yield cx, cy
+
+
+def groupcollide_grid(group_a: pg.sprite.Group, group_b: pg.sprite.Group, cell_size=128) -> None:
+    """
+    2つのグループ間で当たり判定を行い、衝突したSpriteを両方消す関数
+    （pg.sprite.groupcollide(group_a, group_b, True, True) と同じ動作で、同じセルにいる組み合わせだけを調べる）
+    引数1 group_a:グループ
+    引数2 group_b:グループ
+    引数3 cell_size:空間分割するグリッドのセルの一辺の長さ
+    """
+    if not group_a or not group_b:
+        return
+    cells: defaultdict[tuple[int, int], list[Sprite]] = defaultdict(list)
+    for sprite_b in group_b:
+        for cell in _rect_cells(sprite_b.rect, cell_size):
+            cells[cell].append(sprite_b)
+
+    for sprite_a in group_a.sprites():
+        is_hit = False
+        for cell in _rect_cells(sprite_a.rect, cell_size):
+            for sprite_b in cells.get(cell, ()):
+                if sprite_b.alive() and sprite_a.rect.colliderect(sprite_b.rect):
+                    sprite_b.kill()
+                    is_hit = True
+        if is_hit:
+            sprite_a.kill()
+
+
 def gen_beams(image: Surface,
               player: Player, 
               target_angle: float, 
@@ -377,7 +499,7 @@ def gen_beams(image: Surface,
     bullets: list[Bullet] = []
     for i in range(bullet_count):
         rad = i * interval_rad - rad_range / 2 + math.radians(target_angle)
-        bullets.append(Bullet(image, player.rect.center, (math.cos(rad), math.sin(rad)), attackable_group, speed, damage, life_sec, is_destoroy_when_off_screen=True))
+        bullets.append(Bullet(image, player.rect.center, (math.cos(rad), math.sin(rad)), attackable_group, speed, damage, life_sec, is_destoroy_when_off_screen=True, angle=-math.degrees(rad)))
     return bullets
 
 class Enemy_Base(Character):
@@ -396,11 +518,33 @@ class Enemy_Base(Character):
     def get_score(self) -> int:
         return self._score
 
+    def approach(self, target: Character, speed: float, stop_distance: float, delta_time: float) -> bool:
+        """
+        targetに向かってまっすぐ移動する関数
+        引数1: 近づく対象
+        引数2: 速さ
+        引数3: これより近づいたら止まる距離
+        引数4: 前のフレームからの経過時間
+        戻り値: 移動したかどうか
+        """
+        x_diff = target.rect.x - self.rect.x
+        y_diff = target.rect.y - self.rect.y
+        norm_sq = x_diff * x_diff + y_diff * y_diff
+        # 攻撃対象に近づき過ぎたら止まる（0割り対策、平方根を取らずに2乗のまま比較）
+        if norm_sq < stop_distance * stop_distance:
+            return False
+        move = speed * delta_time / math.sqrt(norm_sq)
+        self.rect.move_ip(x_diff * move, y_diff * move)
+        return True
+
 
 class Enemy(Enemy_Base):
     """
     敵に関するクラス
     """
+    # 拡大縮小前の敵画像（最初の敵生成時に一度だけ読み込む）
+    _BASE_IMGS: list[Surface] | None = None
+
     # TODO: グループ周りの引数が多すぎるのでなんとかしたい
     # （この規模ならGameManagerクラスを作って、グループ達をそのクラス変数として持たせてどこからもアクセス出来るようにしてもいいかも）
     def __init__(self, spawn_point: list[int, int], attack_target: Character, effect_group:pg.sprite.Group, hp=20, score=30, speed=100):
@@ -408,24 +552,28 @@ class Enemy(Enemy_Base):
         敵を生成する関数
         引数3: 攻撃を加える対象
         """
-        imgs = [pg.image.load(f"./fig/zonbi{i}.png") for i in range(1, 4)]
-        imgs[0] = pg.transform.scale(imgs[0],(random.randint(90,150),random.randint(90,150)))
-        imgs[1] = pg.transform.scale(imgs[1],(random.randint(90,150),random.randint(90,150)))
-        imgs[2] = pg.transform.scale(imgs[2],(random.randint(90,150),random.randint(90,150)))
-        super().__init__(random.choice(imgs), spawn_point, hp, effect_group, score=score)
+        img = random.choice(self._load_base_imgs())
+        img = pg.transform.scale(img,(random.randint(90,150),random.randint(90,150)))
+        super().__init__(img, spawn_point, hp, effect_group, score=score)
         self.speed = speed
         self.attack_target = attack_target
 
+    @classmethod
+    def _load_base_imgs(cls) -> list[Surface]:
+        """
+        拡大縮小前の敵画像のリストを返す関数
+        戻り値: 敵画像のリスト
+        """
+        if cls._BASE_IMGS is None:
+            cls._BASE_IMGS = [pg.image.load(f"./fig/zonbi{i}.png").convert_alpha() for i in range(1, 4)]
+        return cls._BASE_IMGS
+
     def update(self, dtime):
         """
         敵を移動させる関数
         """
         super().update(dtime)
-        # 攻撃対象に近づき過ぎたら止まる（0割り対策）
-        if calc_norm(self.rect, self.attack_target.rect) < 50:
-            return
-        dir = list(calc_orientation(self.rect, self.attack_target.rect))
-        self.rect.move_ip(dir[0] * self.speed * dtime, dir[1] * self.speed * dtime)
+        self.approach(self.attack_target, self.speed, 50, dtime)
 
 
 class BOSS(Enemy_Base):
@@ -446,12 +594,12 @@ class BOSS(Enemy_Base):
         ボスを生成する関数
         引数3: 攻撃を加える対象
         """
-        super().__init__((pg.transform.rotozoom((pg.image.load(f"./fig/alien2.png")), 0.0, 3.0)), spawn_point, hp, effect_group, score=score)
+        super().__init__((pg.transform.rotozoom(pg.image.load(f"./fig/alien2.png").convert_alpha(), 0.0, 3.0)), spawn_point, hp, effect_group, score=score)
         self.speed = speed
         self.attack_target = attack_target
         self.enemy_bullet_group = enemy_bullet_group
         self._attack_interval_tmr = 0.0
-        self.bullet_img = pg.transform.rotozoom((pg.image.load("./fig/flame.png")), 0, 0.1)
+        self.bullet_img = pg.transform.rotozoom(pg.image.load("./fig/flame.png").convert_alpha(), 0, 0.1)
 
     def update(self, delta_time: float):
         """
@@ -459,11 +607,8 @@ class BOSS(Enemy_Base):
         """
         super().update(delta_time)
 
-        # 攻撃対象に近づき過ぎたら止まる（0割り対策）
-        if calc_norm(self.rect, self.attack_target.rect) < 500:
+        if not self.approach(self.attack_target, self.speed, 500, delta_time):
             return
-        dir = list(calc_orientation(self.rect, self.attack_target.rect))
-        self.rect.move_ip(dir[0] * self.speed * delta_time, dir[1] * self.speed * delta_time)
 
         # 一定間隔で射撃を行う
         if self._attack_interval_tmr > self.ATTACK_INTERVAL_SEC:
@@ -484,7 +629,7 @@ class Background(pg.sprite.Sprite):
         引数2: 背景のデフォルト生成位置からどれだけずらすか
         """
         super().__init__()
-        self.image = pg.image.load("./fig/background.png")
+        self.image = pg.image.load("./fig/background.png").convert()
         self.rect = self.image.get_rect()
         self.rect.topleft = (0, 0)
         self.offset = offset
@@ -544,6 +689,7 @@ class Score:
         self.color = (255, 255, 255)
         self.score = 0
         self.image = self.font.render(f"Score: {self.score}", 0, self.color)
+        self._rendered_score = self.score
         self.rect = self.image.get_rect()
         self.rect.center = 100, camera.screen.get_height() - 50
 
@@ -551,13 +697,15 @@ class Score:
         self.score += add
 
     def update(self, screen: pg.Surface):
-        self.image = self.font.render(f"Score: {self.score}", 0, self.color)
+        # スコアが変わったときだけ描画し直す
+        if self.score != self._rendered_score:
+            self.image = self.font.render(f"Score: {self.score}", 0, self.color)
+            self._rendered_score = self.score
         screen.blit(self.image, self.rect)
 
 def get_random_spawn_pos(range: int=-1) -> tuple[int, int]:
     range = Camera.active_camera.screen.get_width() // 2 + 200 if range < 0 else range
-    spawn_rad = math.radians(random.randint(0, 360))
-    spawn_dir = [math.cos(spawn_rad), -math.sin(spawn_rad)]
+    spawn_dir = UNIT_CIRCLE[random.randint(0, 359)]
     center_pos = Camera.active_camera.center_pos
     return [center_pos[0] + (spawn_dir[0] * range), center_pos[1] + (spawn_dir[1] * range)]
 
@@ -583,6 +731,13 @@ def main():
     flame = Group_support_camera()
     clock = pg.time.Clock()
     score = Score(camera)
+    # 弾の画像（回転画像のキャッシュが効くように毎回作り直さない）
+    beam_img = pg.Surface((20, 10))
+    pg.draw.rect(beam_img, (255, 0, 0), beam_img.get_rect())
+    # 残り時間の表示（フォントは使い回し、秒数が変わったときだけ描画し直す）
+    timer_font = pg.font.Font(None, 128)
+    timer_sec = -1
+    timer_img = None
 
     player_shoot_interval_tmr = 0
     enemy_spawn_interval_sec = 0.5
@@ -733,24 +888,24 @@ def main():
             direction =  calc_orientation(player.rect.center, (mouse_pos[0] + camera.center_pos[0], mouse_pos[1] + camera.center_pos[1]))
             angle = math.degrees(math.atan2(direction[1], direction[0]))
 
-            score_text = pg.Surface((20, 10))
-            pg.draw.rect(score_text, (255, 0, 0), score_text.get_rect())
-            bs = gen_beams(score_text, player, angle, enemies, bullet_count=player.attack_number, speed=1000)
+            bs = gen_beams(beam_img, player, angle, enemies, bullet_count=player.attack_number, speed=1000)
             for b in bs:
                 bullets.add(b)
-            pg.mixer.Sound("./fig/se_bullet.mp3").play()
+            SE_BULLET.play()
         player_shoot_interval_tmr += dtime
 
         camera.update(dtime)
         enemies.update(dtime)
         # 敵とプレイヤーの当たり判定処理
-        for _ in pg.sprite.spritecollide(player, enemies, False):
+        for _ in player.rect.collidelistall([enemy.rect for enemy in enemies]):
             player.give_damage(10)
 
-        bullets.update(dtime, score)
-        flame.update(dtime, score)
+        bullets.update(dtime)
+        flame.update(dtime)
+        collide_bullets(bullets, score)
+        collide_bullets(flame, score)
         # 銃弾とボスの攻撃の当たり判定処理
-        pg.sprite.groupcollide(flame, bullets, True, True)
+        groupcollide_grid(flame, bullets)
 
         effect_group.update(dtime)
 
@@ -779,13 +934,14 @@ def main():
             pg.draw.rect(screen, (0, 0, 0), pg.Rect(0, 0, camera.screen.get_width(), 20))
             pg.draw.rect(screen, (255, 255, 0), pg.Rect(0, 5, camera.screen.get_width() * percent, 10))
         if next_score != next_score_tmp:
-            pg.mixer.Sound("./fig/se_powerup.mp3").play()
+            SE_POWERUP.play()
 
-        font = pg.font.Font(None, 128)
-        score_text = font.render(f"{int(SURVIVE_TIME_SEC - suvive_time_tmr)}", 0, (0, 255, 0))
-        img_rct = score_text.get_rect()
+        if int(SURVIVE_TIME_SEC - suvive_time_tmr) != timer_sec:
+            timer_sec = int(SURVIVE_TIME_SEC - suvive_time_tmr)
+            timer_img = timer_font.render(f"{timer_sec}", 0, (0, 255, 0))
+        img_rct = timer_img.get_rect()
         img_rct.midtop = (WIDTH / 2, 20)
-        screen.blit(score_text, img_rct)
+        screen.blit(timer_img, img_rct)
         pg.display.update()
 
         dtime = clock.tick(max_fps) / 1000